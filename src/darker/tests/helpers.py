@@ -1,7 +1,9 @@
 """Helper functions for unit tests"""
 
+import os
 import sys
 from contextlib import contextmanager
+from pathlib import Path
 from types import ModuleType
 from typing import Generator, Optional
 from unittest.mock import patch
@@ -55,6 +57,21 @@ def flynt_present(present: bool) -> Generator[None, None, None]:
         yield
 
 
+@contextmanager
+def chdir(path: Path) -> Generator[None, None, None]:
+    """Context manager to change the working directory temporarily for a test.
+
+    Like `contextlib.chdir` which is only available on Python 3.11 and later.
+
+    """
+    original_cwd = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(original_cwd)
+
+
 @contextmanager
 def unix_and_windows_newline_repos(request, tmp_path_factory):
     """Create temporary repositories for Unix and windows newlines separately."""
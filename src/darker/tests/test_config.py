@@ -1,22 +1,25 @@
 """Tests for `darker.config`"""
 
-# pylint: disable=unused-argument,too-many-arguments,use-dict-literal
+# pylint: disable=redefined-outer-name,unused-argument,too-many-arguments
 
 from argparse import Namespace
-from pathlib import Path
 
 import pytest
 
 from darker.config import OutputMode
+from darker.tests.helpers import chdir
 from darkgraylib.config import ConfigurationError
 from darkgraylib.testtools.helpers import raises_if_exception
 
 
-@pytest.mark.kwparametrize(
-    dict(diff=False, stdout=False, expect=None),
-    dict(diff=False, stdout=True, expect=None),
-    dict(diff=True, stdout=False, expect=None),
-    dict(diff=True, stdout=True, expect=ConfigurationError),
+@pytest.mark.parametrize(
+    ("diff", "stdout", "expect"),
+    [
+        (False, False, None),
+        (False, True, None),
+        (True, False, None),
+        (True, True, ConfigurationError),
+    ],
 )
 def test_output_mode_validate_diff_stdout(diff, stdout, expect):
     """Validation fails only if ``--diff`` and ``--stdout`` are both enabled"""
@@ -24,97 +27,75 @@ def test_output_mode_validate_diff_stdout(diff, stdout, expect):
         OutputMode.validate_diff_stdout(diff, stdout)
 
 
-@pytest.mark.kwparametrize(
-    dict(stdout=False),
-    dict(stdout=False, src=["first.py"]),
-    dict(stdout=False, src=["first.py", "second.py"]),
-    dict(stdout=False, src=["first.py", "missing.py"]),
-    dict(stdout=False, src=["missing.py"]),
-    dict(stdout=False, src=["missing.py", "another_missing.py"]),
-    dict(stdout=False, src=["directory"]),
-    dict(stdout=True, expect=ConfigurationError),  # input file missing
-    dict(stdout=True, src=["first.py"]),
-    dict(  # too many input files
-        stdout=True, src=["first.py", "second.py"], expect=ConfigurationError
-    ),
-    dict(  # too many input files (even if all but one missing)
-        stdout=True, src=["first.py", "missing.py"], expect=ConfigurationError
-    ),
-    dict(  # input file doesn't exist
-        stdout=True, src=["missing.py"], expect=ConfigurationError
-    ),
-    dict(  # too many input files (even if all but one missing)
-        stdout=True, src=["missing.py", "another.py"], expect=ConfigurationError
-    ),
-    dict(  # input file required, not a directory
-        stdout=True, src=["directory"], expect=ConfigurationError
-    ),
-    dict(stdout=False, stdin_filename="path.py"),
-    dict(stdout=False, src=["first.py"], stdin_filename="path.py"),
-    dict(stdout=False, src=["first.py", "second.py"], stdin_filename="path.py"),
-    dict(stdout=False, src=["first.py", "missing.py"], stdin_filename="path.py"),
-    dict(stdout=False, src=["missing.py"], stdin_filename="path.py"),
-    dict(
-        stdout=False, src=["missing.py", "another_missing.py"], stdin_filename="path.py"
-    ),
-    dict(stdout=False, src=["directory"], stdin_filename="path.py"),
-    dict(stdout=True, stdin_filename="path.py"),
-    dict(  # too many input files, here from two different command line arguments
-        stdout=True,
-        src=["first.py"],
-        stdin_filename="path.py",
-        expect=ConfigurationError,
-    ),
-    dict(  # too many input files, here from two different command line arguments
-        stdout=True,
-        src=["first.py", "second.py"],
-        stdin_filename="path.py",
-        expect=ConfigurationError,
-    ),
-    dict(  # too many input files, here from two different command line arguments
-        stdout=True,
-        src=["first.py", "missing.py"],
-        stdin_filename="path.py",
-        expect=ConfigurationError,
-    ),
-    dict(  # too many input files (even if positional file is missing)
-        stdout=True,
-        src=["missing.py"],
-        stdin_filename="path.py",
-        expect=ConfigurationError,
-    ),
-    dict(  # too many input files, here from two different command line arguments
-        stdout=True,
-        src=["missing.py", "another.py"],
-        stdin_filename="path.py",
-        expect=ConfigurationError,
-    ),
-    dict(  # too many input files, here from two different command line arguments
-        stdout=True,
-        src=["directory"],
-        stdin_filename="path.py",
-        expect=ConfigurationError,
-    ),
-    src=[],
-    stdin_filename=None,
-    expect=None,
+@pytest.fixture(scope="module")
+def stdout_src_sandbox(tmp_path_factory):
+    """Directory with ``first.py`` and ``second.py`` for the ``--stdout`` tests."""
+    sandbox = tmp_path_factory.mktemp("stdout_src")
+    (sandbox / "first.py").touch()
+    (sandbox / "second.py").touch()
+    return sandbox
+
+
+@pytest.mark.parametrize(
+    ("stdout", "src", "stdin_filename", "expect"),
+    [
+        (False, [], None, None),
+        (False, ["first.py"], None, None),
+        (False, ["first.py", "second.py"], None, None),
+        (False, ["first.py", "missing.py"], None, None),
+        (False, ["missing.py"], None, None),
+        (False, ["missing.py", "another_missing.py"], None, None),
+        (False, ["directory"], None, None),
+        (True, [], None, ConfigurationError),  # input file missing
+        (True, ["first.py"], None, None),
+        # too many input files
+        (True, ["first.py", "second.py"], None, ConfigurationError),
+        # too many input files (even if all but one missing)
+        (True, ["first.py", "missing.py"], None, ConfigurationError),
+        # input file doesn't exist
+        (True, ["missing.py"], None, ConfigurationError),
+        # too many input files (even if all but one missing)
+        (True, ["missing.py", "another.py"], None, ConfigurationError),
+        # input file required, not a directory
+        (True, ["directory"], None, ConfigurationError),
+        (False, [], "path.py", None),
+        (False, ["first.py"], "path.py", None),
+        (False, ["first.py", "second.py"], "path.py", None),
+        (False, ["first.py", "missing.py"], "path.py", None),
+        (False, ["missing.py"], "path.py", None),
+        (False, ["missing.py", "another_missing.py"], "path.py", None),
+        (False, ["directory"], "path.py", None),
+        (True, [], "path.py", None),
+        # too many input files, here from two different command line arguments
+        (True, ["first.py"], "path.py", ConfigurationError),
+        # too many input files, here from two different command line arguments
+        (True, ["first.py", "second.py"], "path.py", ConfigurationError),
+        # too many input files, here from two different command line arguments
+        (True, ["first.py", "missing.py"], "path.py", ConfigurationError),
+        # too many input files (even if positional file is missing)
+        (True, ["missing.py"], "path.py", ConfigurationError),
+        # too many input files, here from two different command line arguments
+        (True, ["missing.py", "another.py"], "path.py", ConfigurationError),
+        # too many input files, here from two different command line arguments
+        (True, ["directory"], "path.py", ConfigurationError),
+    ],
 )
 def test_output_mode_validate_stdout_src(
-    tmp_path, monkeypatch, stdout, src, stdin_filename, expect
+    stdout_src_sandbox, stdout, src, stdin_filename, expect
 ):
     """Validation fails only if exactly one file isn't provided for ``--stdout``"""
-    monkeypatch.chdir(tmp_path)
-    Path("first.py").touch()
-    Path("second.py").touch()
-    with raises_if_exception(expect):
+    with chdir(stdout_src_sandbox), raises_if_exception(expect):
         OutputMode.validate_stdout_src(src, stdin_filename, stdout=stdout)
 
 
-@pytest.mark.kwparametrize(
-    dict(diff=False, stdout=False, expect="NOTHING"),
-    dict(diff=False, stdout=True, expect="CONTENT"),
-    dict(diff=True, stdout=False, expect="DIFF"),
-    dict(diff=True, stdout=True, expect=ConfigurationError),
+@pytest.mark.parametrize(
+    ("diff", "stdout", "expect"),
+    [
+        (False, False, "NOTHING"),
+        (False, True, "CONTENT"),
+        (True, False, "DIFF"),
+        (True, True, ConfigurationError),
+    ],
 )
 def test_output_mode_from_args(diff, stdout, expect):
     """Correct output mode results from the ``--diff`` and ``stdout`` options"""
@@ -1,9 +1,8 @@
 """Unit tests for `darker.diff`"""
 
-# pylint: disable=use-dict-literal
+from __future__ import annotations
 
-from itertools import chain
-from typing import List, Literal, Tuple
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -15,6 +14,9 @@ from darkgraylib.testtools.diff_helpers import (
 )
 from darkgraylib.utils import TextDocument
 
+if TYPE_CHECKING:
+    from typing import Literal
+
 
 def test_opcodes_to_chunks():
     """``opcode_to_chunks()`` chucks opcodes correctly"""
@@ -96,8 +98,8 @@ def test_opcodes_to_chunks():
     ]
 
 
-EXAMPLE_OPCODES: List[
-    Tuple[Literal["replace", "delete", "insert", "equal"], int, int, int, int]
+EXAMPLE_OPCODES: list[
+    tuple[Literal["replace", "delete", "insert", "equal"], int, int, int, int]
 ] = [
     # 0-based, end-exclusive
     ("replace", 0, 4, 0, 1),
@@ -119,35 +121,26 @@ EXAMPLE_OPCODES: List[
 ]
 
 
-@pytest.mark.kwparametrize(
-    dict(
-        context_lines=0,
-        multiline_string_ranges=[],
-        expect=[0, 3, 4, 12, 13, 16, 19, 21, 22, 26, [28, 37]],  # 0-based
-    ),
-    dict(
-        context_lines=1,
-        multiline_string_ranges=[],
-        expect=[[0, 5], [11, 23], [25, 38]],  # 0-based, end-inclusive
-    ),
-    dict(
-        context_lines=2,
-        multiline_string_ranges=[],
-        expect=[[0, 6], [10, 38]],  # 0-based, end-inclusive
-    ),
-    dict(
-        context_lines=0,
-        multiline_string_ranges=[  # 0-based, end exclusive
-            (2, 4),  # partial left overlap with (3, 5)
-            (13, 15),  # partial right overlap with (12, 14)
-            (16, 17),  # exact overlap with (16, 17)
-            (18, 21),  # overextending overlap with (19, 20)
-            (22, 27),  # inner overlap with (21, 23) and full overlap with (26, 27)
-            (28, 30),  # full overlap with (28, 38)...
-            (36, 46),  # ...partial left overlap with (28, 38)
-        ],
-        expect=[0, [2, 4], [12, 14], 16, [18, 26], [28, 45]],  # 0-based, end-inclusive
-    ),
+@pytest.mark.parametrize(
+    ("context_lines", "multiline_string_ranges", "expect"),
+    [
+        (0, [], [0, 3, 4, 12, 13, 16, 19, 21, 22, 26, [28, 37]]),  # 0-based
+        (1, [], [[0, 5], [11, 23], [25, 38]]),  # 0-based, end-inclusive
+        (2, [], [[0, 6], [10, 38]]),  # 0-based, end-inclusive
+        (
+            0,
+            [  # 0-based, end exclusive
+                (2, 4),  # partial left overlap with (3, 5)
+                (13, 15),  # partial right overlap with (12, 14)
+                (16, 17),  # exact overlap with (16, 17)
+                (18, 21),  # overextending overlap with (19, 20)
+                (22, 27),  # inner overlap with (21, 23) and full overlap with (26, 27)
+                (28, 30),  # full overlap with (28, 38)...
+                (36, 46),  # ...partial left overlap with (28, 38)
+            ],
+            [0, [2, 4], [12, 14], 16, [18, 26], [28, 45]],  # 0-based, end-inclusive
+        ),
+    ],
 )
 def test_opcodes_to_edit_linenums(context_lines, multiline_string_ranges, expect):
     """`opcodes_to_edit_linenums()` gives correct results"""
@@ -163,7 +156,7 @@ def test_opcodes_to_edit_linenums(context_lines, multiline_string_ranges, expect
     )
     # Normalize expected lines/ranges to 0-based, end-exclusive.
     expect_ranges = [[n, n] if isinstance(n, int) else n for n in expect]
-    expect_linenums = list(chain(*(range(n[0], n[1] + 1) for n in expect_ranges)))
+    expect_linenums = [n for start, end in expect_ranges for n in range(start, end + 1)]
 
     # Normalize result to 0-based, end-exclusive before comparison
     assert [linenum - 1 for linenum in edit_linenums] == expect_linenums
@@ -2,6 +2,8 @@
 
 from difflib import SequenceMatcher
 
+import pytest
+
 from darker.tests.git_diff_example_output import (
     BLANK_SEP_CHANGED,
     BLANK_SEP_ORIGINAL,
@@ -12,45 +14,34 @@ from darker.tests.git_diff_example_output import (
 )
 
 
-def test_sequencematcher():
-    """``SequenceMatcher`` detects a single changed line in between correctly"""
-    matcher = SequenceMatcher(
-        None, ORIGINAL.splitlines(), CHANGED.splitlines(), autojunk=False
-    )
-    assert matcher.get_opcodes() == [
-        ("equal", 0, 1, 0, 1),
-        ("replace", 1, 2, 1, 2),
-        ("equal", 2, 3, 2, 3),
-    ]
-
-
-def test_sequencematcher_blank_separated_changes_unchanged_sandwiched():
-    """``SequenceMatcher`` detects blank line delimited unchanged region correctly"""
-    matcher = SequenceMatcher(
-        None,
-        BLANK_SEP_SANDWICH_ORIGINAL.splitlines(),
-        BLANK_SEP_SANDWICH_CHANGED.splitlines(),
-        autojunk=False,
-    )
-    assert matcher.get_opcodes() == [
-        ("replace", 0, 1, 0, 1),
-        ("equal", 1, 4, 1, 4),
-        ("replace", 4, 5, 4, 5),
-    ]
-
-
-def test_sequencematcher_blank_separated_changes():
-    """``SequenceMatcher`` detects blank line delimited changes correctly"""
-    matcher = SequenceMatcher(
-        None,
-        BLANK_SEP_ORIGINAL.splitlines(),
-        BLANK_SEP_CHANGED.splitlines(),
-        autojunk=False,
-    )
-    assert matcher.get_opcodes() == [
-        ("replace", 0, 1, 0, 1),
-        ("equal", 1, 2, 1, 2),
-        ("replace", 2, 3, 2, 3),
-        ("equal", 3, 4, 3, 4),
-        ("replace", 4, 5, 4, 5),
-    ]
+@pytest.mark.parametrize(
+    ("original_lines", "changed_lines", "expect"),
+    [
+        (
+            ORIGINAL.splitlines(),
+            CHANGED.splitlines(),
+            [("equal", 0, 1, 0, 1), ("replace", 1, 2, 1, 2), ("equal", 2, 3, 2, 3)],
+        ),
+        (
+            BLANK_SEP_SANDWICH_ORIGINAL.splitlines(),
+            BLANK_SEP_SANDWICH_CHANGED.splitlines(),
+            [("replace", 0, 1, 0, 1), ("equal", 1, 4, 1, 4), ("replace", 4, 5, 4, 5)],
+        ),
+        (
+            BLANK_SEP_ORIGINAL.splitlines(),
+            BLANK_SEP_CHANGED.splitlines(),
+            [
+                ("replace", 0, 1, 0, 1),
+                ("equal", 1, 2, 1, 2),
+                ("replace", 2, 3, 2, 3),
+                ("equal", 3, 4, 3, 4),
+                ("replace", 4, 5, 4, 5),
+            ],
+        ),
+    ],
+    ids=["single_change", "blank_sep_unchanged_sandwiched", "blank_sep_changes"],
+)
+def test_sequencematcher(original_lines, changed_lines, expect):
+    """``SequenceMatcher`` detects changed and unchanged regions correctly"""
+    matcher = SequenceMatcher(None, original_lines, changed_lines, autojunk=False)
+    assert matcher.get_opcodes() == expect
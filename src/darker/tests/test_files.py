@@ -1,6 +1,6 @@
 """Test for the `darker.files` module."""
 
-# pylint: disable=use-dict-literal
+# pylint: disable=redefined-outer-name
 
 from pathlib import Path
 
@@ -9,27 +9,40 @@ import pytest
 from darker import files
 
 
-@pytest.mark.kwparametrize(
-    dict(start="only_pyproject/subdir", expect="only_pyproject/pyproject.toml"),
-    dict(start="only_git/subdir", expect=None),
-    dict(start="git_and_pyproject/subdir", expect="git_and_pyproject/pyproject.toml"),
+@pytest.fixture(scope="module")
+def pyproject_toml_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory tree with ``pyproject.toml`` files and ``.git`` directories."""
+    root = tmp_path_factory.mktemp("find_pyproject_toml")
+    for project, has_git, has_pyproject_toml in [
+        ("only_pyproject", False, True),
+        ("only_git", True, False),
+        ("git_and_pyproject", True, True),
+    ]:
+        (root / project / "subdir").mkdir(parents=True)
+        if has_git:
+            (root / project / ".git").mkdir()
+        if has_pyproject_toml:
+            (root / project / "pyproject.toml").touch()
+    return root
+
+
+@pytest.mark.parametrize(
+    ("start", "expect"),
+    [
+        ("only_pyproject/subdir", "only_pyproject/pyproject.toml"),
+        ("only_git/subdir", None),
+        ("git_and_pyproject/subdir", "git_and_pyproject/pyproject.toml"),
+    ],
 )
-def test_find_pyproject_toml(tmp_path: Path, start: str, expect: str) -> None:
+def test_find_pyproject_toml(
+    pyproject_toml_tree: Path, start: str, expect: str
+) -> None:
     """Test `files.find_pyproject_toml` with no user home directory."""
-    (tmp_path / "only_pyproject").mkdir()
-    (tmp_path / "only_pyproject" / "pyproject.toml").touch()
-    (tmp_path / "only_pyproject" / "subdir").mkdir()
-    (tmp_path / "only_git").mkdir()
-    (tmp_path / "only_git" / ".git").mkdir()
-    (tmp_path / "only_git" / "subdir").mkdir()
-    (tmp_path / "git_and_pyproject").mkdir()
-    (tmp_path / "git_and_pyproject" / ".git").mkdir()
-    (tmp_path / "git_and_pyproject" / "pyproject.toml").touch()
-    (tmp_path / "git_and_pyproject" / "subdir").mkdir()
-
-    result = files.find_pyproject_toml(path_search_start=(str(tmp_path / start),))
+    result = files.find_pyproject_toml(
+        path_search_start=(str(pyproject_toml_tree / start),)
+    )
 
     if not expect:
         assert result is None
     else:
-        assert result == str(tmp_path / expect)
+        assert result == str(pyproject_toml_tree / expect)
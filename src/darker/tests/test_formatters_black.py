@@ -1,6 +1,6 @@
 """Unit tests for `darker.black_formatter`"""
 
-# pylint: disable=too-many-arguments,use-dict-literal
+# pylint: disable=redefined-outer-name,too-many-arguments,use-dict-literal
 
 import re
 import sys
@@ -18,7 +18,7 @@ from black import Mode, TargetVersion
 import darker.formatters.black_formatter
 from darker.exceptions import DependencyError
 from darker.files import DEFAULT_EXCLUDE_RE, filter_python_files
-from darker.formatters import create_formatter
+from darker.formatters import black_wrapper, create_formatter
 from darker.formatters.black_formatter import BlackFormatter
 from darker.tests.helpers import black_present
 from darkgraylib.config import ConfigurationError
@@ -45,11 +45,15 @@ class RegexEquality:
 
     pattern: str
     flags: int = field(default=re.UNICODE)
+    expect_flags: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Precompute the flags an equal compiled pattern is expected to have."""
+        self.expect_flags = re.compile(self.pattern).flags | self.flags
 
     def __eq__(self, other):
         return (
-            other.pattern == self.pattern
-            and other.flags & 0x1FF == re.compile(self.pattern).flags | self.flags
+            other.pattern == self.pattern and other.flags & 0x1FF == self.expect_flags
         )
 
 
@@ -147,15 +151,16 @@ def test_formatter_without_black(caplog):
     ),
     config_path=None,
 )
-def test_read_config(tmpdir, option_name_delimiter, config_path, config_lines, expect):
+def test_read_config(
+    tmp_path, option_name_delimiter, config_path, config_lines, expect
+):
     """``read_config()`` reads Black config correctly from a TOML file."""
     # Test both hyphen and underscore delimited option names
     config = "\n".join(
         line.replace("-", option_name_delimiter) for line in config_lines
     )
-    tmpdir = Path(tmpdir)
-    src = tmpdir / "src.py"
-    toml = tmpdir / (config_path or "pyproject.toml")
+    src = tmp_path / "src.py"
+    toml = tmp_path / (config_path or "pyproject.toml")
     toml.write_text(f"[tool.black]\n{config}\n")
     with raises_or_matches(expect, []):
         formatter = BlackFormatter()
@@ -169,6 +174,41 @@ def test_read_config(tmpdir, option_name_delimiter, config_path, config_lines, e
         assert formatter.config == expect
 
 
+FILTER_PYTHON_FILES_NAMES = [
+    "none.py",
+    "exclude.py",
+    "extend.py",
+    "force.py",
+    "exclude+extend.py",
+    "exclude+force.py",
+    "extend+force.py",
+    "exclude+extend+force.py",
+    "none+explicit.py",
+    "exclude+explicit.py",
+    "extend+explicit.py",
+    "force+explicit.py",
+    "exclude+extend+explicit.py",
+    "exclude+force+explicit.py",
+    "extend+force+explicit.py",
+    "exclude+extend+force+explicit.py",
+]
+FILTER_PYTHON_FILES_EXPLICIT = frozenset(
+    Path(name) for name in FILTER_PYTHON_FILES_NAMES if name.endswith("+explicit.py")
+)
+FILTER_PYTHON_FILES_PATTERNS = {
+    name: regex.compile(name) for name in ["exclude", "extend", "force"]
+}
+
+
+@pytest.fixture(scope="module")
+def filter_python_files_root(tmp_path_factory):
+    """Directory with empty Python files for `test_filter_python_files`."""
+    root = tmp_path_factory.mktemp("filter_python_files")
+    for name in FILTER_PYTHON_FILES_NAMES:
+        (root / name).touch()
+    return root
+
+
 @pytest.mark.kwparametrize(
     dict(
         expect={
@@ -199,56 +239,35 @@ def test_read_config(tmpdir, option_name_delimiter, config_path, config_lines, e
     force_exclude=None,
 )
 def test_filter_python_files(  # pylint: disable=too-many-arguments
-    tmp_path, monkeypatch, exclude, extend_exclude, force_exclude, expect
+    filter_python_files_root,
+    monkeypatch,
+    exclude,
+    extend_exclude,
+    force_exclude,
+    expect,
 ):
     """``filter_python_files()`` skips excluded files correctly"""
-    monkeypatch.chdir(tmp_path)
-    names = {
-        Path(name)
-        for name in [
-            "none.py",
-            "exclude.py",
-            "extend.py",
-            "force.py",
-            "exclude+extend.py",
-            "exclude+force.py",
-            "extend+force.py",
-            "exclude+extend+force.py",
-            "none+explicit.py",
-            "exclude+explicit.py",
-            "extend+explicit.py",
-            "force+explicit.py",
-            "exclude+extend+explicit.py",
-            "exclude+force+explicit.py",
-            "extend+force+explicit.py",
-            "exclude+extend+force+explicit.py",
-        ]
-    }
-    paths = {tmp_path / name for name in names}
-    for path in paths:
-        path.touch()
+    monkeypatch.chdir(filter_python_files_root)
     black_config: BlackCompatibleConfig = {
-        "exclude": regex.compile(exclude) if exclude else DEFAULT_EXCLUDE_RE,
-        "extend_exclude": regex.compile(extend_exclude) if extend_exclude else None,
-        "force_exclude": regex.compile(force_exclude) if force_exclude else None,
-    }
-    explicit = {
-        Path("none+explicit.py"),
-        Path("exclude+explicit.py"),
-        Path("extend+explicit.py"),
-        Path("force+explicit.py"),
-        Path("exclude+extend+explicit.py"),
-        Path("exclude+force+explicit.py"),
-        Path("extend+force+explicit.py"),
-        Path("exclude+extend+force+explicit.py"),
+        "exclude": (
+            FILTER_PYTHON_FILES_PATTERNS[exclude] if exclude else DEFAULT_EXCLUDE_RE
+        ),
+        "extend_exclude": (
+            FILTER_PYTHON_FILES_PATTERNS[extend_exclude] if extend_exclude else None
+        ),
+        "force_exclude": (
+            FILTER_PYTHON_FILES_PATTERNS[force_exclude] if force_exclude else None
+        ),
     }
     formatter = BlackFormatter()
     formatter.config = black_config
 
-    result = filter_python_files({Path()} | explicit, tmp_path, formatter)
+    result = filter_python_files(
+        {Path(), *FILTER_PYTHON_FILES_EXPLICIT}, filter_python_files_root, formatter
+    )
 
-    expect_paths = {Path(f"{path}.py") for path in expect} | explicit
-    assert result == expect_paths
+    expect_paths = {Path(f"{path}.py") for path in expect}
+    assert result == expect_paths | FILTER_PYTHON_FILES_EXPLICIT
 
 
 def test_run_ignores_excludes():
@@ -333,8 +352,8 @@ def test_run_configuration(
 ):
     """`BlackFormatter.run` passes correct configuration to Black."""
     src = TextDocument.from_str("import  os\n")
-    with patch(
-        "darker.formatters.black_wrapper.format_str"
+    with patch.object(
+        black_wrapper, "format_str"
     ) as format_str, raises_or_matches(expect, []) as check:
         format_str.return_value = "import os\n"
         formatter = BlackFormatter()
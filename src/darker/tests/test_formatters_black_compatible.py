@@ -18,6 +18,7 @@ from darkgraylib.utils import TextDocument
 @pytest.mark.parametrize(
     "formatter_setup",
     [(BlackFormatter, "-"), (BlackFormatter, "_"), (RuffFormatter, "-")],
+    ids=["black-dash", "black-underscore", "ruff-dash"],
 )
 @pytest.mark.kwparametrize(
     dict(
@@ -60,7 +61,7 @@ def test_read_config_black_and_ruff(
 
 @pytest.mark.parametrize("formatter_class", [BlackFormatter, RuffFormatter])
 @pytest.mark.parametrize("encoding", ["utf-8", "iso-8859-1"])
-@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["unix", "windows"])
 def test_run(formatter_class, encoding, newline):
     """Running formatter through their plugin ``run`` method gives correct results."""
     src = TextDocument.from_lines(
@@ -85,8 +86,9 @@ def test_run(formatter_class, encoding, newline):
         (BlackFormatter, "darker.formatters.black_wrapper.format_str"),
         (RuffFormatter, "darker.formatters.ruff_formatter._ruff_format_stdin"),
     ],
+    ids=["black", "ruff"],
 )
-@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["unix", "windows"])
 def test_run_always_uses_unix_newlines(formatter_setup, newline):
     """Content is always passed to Black and Ruff with Unix newlines."""
     formatter_class, formatter_func_name = formatter_setup
@@ -35,7 +35,7 @@ def test_get_supported_target_versions():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ruff():
     """Make a Ruff call and return the `subprocess.CompletedProcess` instance."""
     cmdline = [
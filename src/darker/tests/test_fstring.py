@@ -18,12 +18,13 @@ MODIFIED_SOURCE = ("'{}'.format( x)", "#", "'{0}'.format( 42)")
 FLYNTED_SOURCE = ("f'{x}'", "#", "f'{42}'")
 
 
-@pytest.mark.parametrize("present", [True, False])
-def test_fstring_importable_with_and_without_flynt(present):
+def test_fstring_importable_with_and_without_flynt():
     """Make sure ``import darker.fstring`` works with and without ``flynt``"""
     try:
-        with flynt_present(present):
-
+        with flynt_present(present=True):
+            # Import when a dummy `flynt` package has been injected temporarily
+            reload(darker.fstring)
+        with flynt_present(present=False):
             # Import when `flynt` has been removed temporarily
             reload(darker.fstring)
     finally:
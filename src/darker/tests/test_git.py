@@ -4,6 +4,7 @@
 # pylint: disable=too-many-lines,use-dict-literal
 
 import os
+import shutil
 from pathlib import Path
 from subprocess import DEVNULL, check_call  # nosec
 from textwrap import dedent  # nosec
@@ -17,6 +18,11 @@ from darkgraylib.git import WORKTREE, RevisionRange
 from darkgraylib.testtools.git_repo_plugin import GitRepoFixture, branched_repo
 from darkgraylib.utils import TextDocument
 
+# Most tests in this module run Git, so skip them all if it isn't installed
+pytestmark = pytest.mark.skipif(
+    shutil.which("git") is None, reason="Git executable not found"
+)
+
 
 @pytest.mark.kwparametrize(
     dict(path="file.py", expect="file.py"),
@@ -47,12 +53,12 @@ def test_get_path_in_repo(path, expect):
     dict(path="main.pyo", create=True, expect=False),
     dict(path="main.js", create=True, expect=False),
 )
-def test_should_reformat_file(tmpdir, path, create, expect):
+def test_should_reformat_file(tmp_path, path, create, expect):
     """``should_reformat_file()`` only returns ``True`` for ``.py`` files which exist"""
     if create:
-        (tmpdir / path).ensure()
+        (tmp_path / path).touch()
 
-    result = git.should_reformat_file(Path(tmpdir / path))
+    result = git.should_reformat_file(tmp_path / path)
 
     assert result == expect
 
@@ -144,50 +150,29 @@ def test_git_exists_in_revision(
     assert result == expect
 
 
+# All paths in `exists_missing_test_repo`, relative to the root or to the `x/` subdir
+EXISTS_MISSING_PATHS = frozenset({"x/dir", "x/dir/a.py", "x/dir/sub", "x/dir/sub/b.py"})
+EXISTS_MISSING_PATHS_IN_X = frozenset({"dir", "dir/a.py", "dir/sub", "dir/sub/b.py"})
+
+
 @pytest.mark.kwparametrize(
+    dict(paths=EXISTS_MISSING_PATHS, rev2="{add}", expect=set()),
+    dict(paths=EXISTS_MISSING_PATHS, rev2="{del_a}", expect={"x/dir/a.py"}),
+    dict(paths=EXISTS_MISSING_PATHS, rev2="HEAD", expect=EXISTS_MISSING_PATHS),
+    dict(paths=EXISTS_MISSING_PATHS, rev2=":WORKTREE:", expect=EXISTS_MISSING_PATHS),
+    dict(paths=EXISTS_MISSING_PATHS_IN_X, cwd="x", rev2="{add}", expect=set()),
+    dict(paths=EXISTS_MISSING_PATHS_IN_X, cwd="x", rev2="{del_a}", expect={"dir/a.py"}),
     dict(
-        paths={"x/dir", "x/dir/a.py", "x/dir/sub", "x/dir/sub/b.py"},
-        rev2="{add}",
-        expect=set(),
-    ),
-    dict(
-        paths={"x/dir", "x/dir/a.py", "x/dir/sub", "x/dir/sub/b.py"},
-        rev2="{del_a}",
-        expect={"x/dir/a.py"},
-    ),
-    dict(
-        paths={"x/dir", "x/dir/a.py", "x/dir/sub", "x/dir/sub/b.py"},
-        rev2="HEAD",
-        expect={"x/dir", "x/dir/a.py", "x/dir/sub", "x/dir/sub/b.py"},
-    ),
-    dict(
-        paths={"x/dir", "x/dir/a.py", "x/dir/sub", "x/dir/sub/b.py"},
-        rev2=":WORKTREE:",
-        expect={"x/dir", "x/dir/a.py", "x/dir/sub", "x/dir/sub/b.py"},
-    ),
-    dict(
-        paths={"dir", "dir/a.py", "dir/sub", "dir/sub/b.py"},
-        cwd="x",
-        rev2="{add}",
-        expect=set(),
-    ),
-    dict(
-        paths={"dir", "dir/a.py", "dir/sub", "dir/sub/b.py"},
-        cwd="x",
-        rev2="{del_a}",
-        expect={"dir/a.py"},
-    ),
-    dict(
-        paths={"dir", "dir/a.py", "dir/sub", "dir/sub/b.py"},
+        paths=EXISTS_MISSING_PATHS_IN_X,
         cwd="x",
         rev2="HEAD",
-        expect={"dir", "dir/a.py", "dir/sub", "dir/sub/b.py"},
+        expect=EXISTS_MISSING_PATHS_IN_X,
     ),
     dict(
-        paths={"dir", "dir/a.py", "dir/sub", "dir/sub/b.py"},
+        paths=EXISTS_MISSING_PATHS_IN_X,
         cwd="x",
         rev2=":WORKTREE:",
-        expect={"dir", "dir/a.py", "dir/sub", "dir/sub/b.py"},
+        expect=EXISTS_MISSING_PATHS_IN_X,
     ),
     cwd=".",
     git_cwd=".",
@@ -282,9 +267,25 @@ def git_get_modified_python_files_repo(request, tmp_path_factory):
         yield repo
 
 
+@pytest.mark.parametrize("paths", [["a.py"], [], ["h.py"]])
+def test_git_get_modified_python_files_unmodified(
+    git_get_modified_python_files_repo, paths
+):
+    """`darker.git.git_get_modified_python_files()` in an unmodified working tree."""
+    # The module-scoped repository is read in place without a temporary copy. This
+    # relies on `test_git_get_modified_python_files` only ever modifying copies made
+    # with `make_temp_copy()`, never the fixture repository itself.
+    root = git_get_modified_python_files_repo.root
+    revrange = RevisionRange("HEAD", ":WORKTREE:")
+
+    result = git.git_get_modified_python_files(
+        {root / p for p in paths}, revrange, repo_root=root
+    )
+
+    assert result == set()
+
+
 @pytest.mark.kwparametrize(
-    dict(paths=["a.py"], expect=[]),
-    dict(expect=[]),
     dict(modify_paths={"a.py": "new"}, expect=["a.py"]),
     dict(modify_paths={"a.py": "new"}, paths=["b.py"], expect=[]),
     dict(modify_paths={"a.py": "new"}, paths=["a.py", "b.py"], expect=["a.py"]),
@@ -295,8 +296,6 @@ def git_get_modified_python_files_repo(request, tmp_path_factory):
     dict(modify_paths={"a.py": "original"}, paths=["a.py"], expect=[]),
     dict(modify_paths={"a.py": None}, paths=["a.py"], expect=[]),
     dict(modify_paths={"h.py": "untracked"}, paths=["h.py"], expect=["h.py"]),
-    dict(paths=["h.py"], expect=[]),
-    modify_paths={},
     paths=[],
 )
 def test_git_get_modified_python_files(